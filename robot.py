@@ -10,7 +10,9 @@ import numpy as np
 import threading
 import time
 import queue
-from collections import deque
+import argparse
+from collections import deque, OrderedDict
+from urllib.parse import quote_plus, urlparse, parse_qs
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import selenium
@@ -25,8 +27,19 @@ from datetime import datetime
 import re
 
 
+YOUTUBE_KIDS_URL = "https://www.youtubekids.com/"
+SEARCH_URL = "https://www.youtubekids.com/search?q={}"
+
+# Seconds a page load may hold the driver (and the GUI waiting on it)
+PAGE_LOAD_TIMEOUT = 10
+
+# Searches prefetched into background tabs at startup
+POPULAR_SEARCHES = ["baby shark", "peppa pig", "cocomelon"]
+
+
 class YouTubeKidsVoiceController:
-    def __init__(self):
+    def __init__(self, debugger_address=None, profile_dir=None,
+                 search_cache_size=5):
         # Initialize Whisper model
         self.whisper_model = None
         self.load_whisper_model()
@@ -43,6 +56,15 @@ class YouTubeKidsVoiceController:
         self.processing = False
         self.driver = None
 
+        # Browser settings
+        self.debugger_address = debugger_address  # e.g. "127.0.0.1:9222"
+        self.profile_dir = profile_dir
+
+        # LRU cache of search term -> window handle of its results tab
+        self.SEARCH_CACHE_SIZE = search_cache_size
+        self.search_tabs = OrderedDict()
+        self.driver_lock = threading.RLock()
+
         # Audio buffer for wake word detection
         self.audio_buffer = deque(maxlen=self.RATE * 3)  # 3 seconds buffer
 
@@ -174,29 +196,79 @@ Say "Hey Robot" followed by:
 
             # Chrome options
             chrome_options = Options()
-            chrome_options.add_argument(
-                "--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option(
-                "excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option(
-                'useAutomationExtension', False)
-            chrome_options.add_argument("--start-maximized")
+            # Don't wait for every subresource before a search is usable
+            chrome_options.page_load_strategy = "eager"
+            if self.debugger_address:
+                # Attach to an already-running Chrome, e.g. one started with
+                # --remote-debugging-port=9222 --user-data-dir=<profile>
+                chrome_options.add_experimental_option(
+                    "debuggerAddress", self.debugger_address)
+            else:
+                chrome_options.add_argument(
+                    "--disable-blink-features=AutomationControlled")
+                chrome_options.add_experimental_option(
+                    "excludeSwitches", ["enable-automation"])
+                chrome_options.add_experimental_option(
+                    'useAutomationExtension', False)
+                chrome_options.add_argument("--start-maximized")
+                if self.profile_dir:
+                    chrome_options.add_argument(
+                        f"--user-data-dir={self.profile_dir}")
 
             # Initialize driver
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
-            # Navigate to YouTube Kids
-            self.driver.get("https://www.youtubekids.com/")
+            # Navigate to YouTube Kids, reusing an open tab when attached
+            if not self.find_youtube_kids_tab():
+                if self.debugger_address:
+                    # Leave the user's own tabs alone
+                    self.driver.switch_to.new_window('tab')
+                self.driver.get(YOUTUBE_KIDS_URL)
 
             self.log_message("✅ YouTube Kids loaded successfully!")
 
+            # Commands wait on driver_lock while a search tab loads, so
+            # keep that wait short
+            self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+
+            # Warm up tabs for popular searches
+            if self.SEARCH_CACHE_SIZE > 0:
+                threading.Thread(
+                    target=self.prefetch_searches,
+                    args=(POPULAR_SEARCHES,),
+                    daemon=True).start()
+
         except Exception as e:
             self.log_message(f"❌ Error loading YouTube Kids: {e}")
             self.log_message(
                 "Please install ChromeDriver: pip install selenium")
 
+    def find_youtube_kids_tab(self):
+        """Switch to an already open YouTube Kids tab, if there is one"""
+        if not self.debugger_address:
+            return False
+
+        # Read tab URLs over DevTools so the user's tabs aren't brought to
+        # the front one by one; window handles are DevTools target ids
+        try:
+            targets = self.driver.execute_cdp_cmd(
+                "Target.getTargets", {})["targetInfos"]
+        except Exception:
+            return False
+
+        handles = self.driver.window_handles
+        for target in targets:
+            if (target["type"] == "page"
+                    and target["targetId"] in handles
+                    and target["url"].startswith(YOUTUBE_KIDS_URL)):
+                self.driver.switch_to.window(target["targetId"])
+                self.log_message("♻️ Reusing open YouTube Kids tab")
+                return True
+
+        return False
+
     def log_message(self, message):
         """Add message to log with timestamp"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -384,56 +456,58 @@ Say "Hey Robot" followed by:
         # Remove wake word if it's still in the command
         command = re.sub(r"hey robot[s]?", "", command).strip()
 
-        try:
-            if not self.driver:
-                self.log_message("❌ YouTube Kids not loaded!")
-                return
-
-            # Search commands
-            if any(word in command for word in ["find", "search", "look for", "show me"]):
-                search_term = self.extract_search_term(command)
-                if search_term:
-                    self.search_youtube_kids(search_term)
-                else:
-                    self.log_message("❌ No search term found")
-
-            # Playback controls
-            elif any(word in command for word in ["play", "start"]) and "list" not in command:
-                self.press_play_pause()
-                self.log_message("▶️ Playing video")
-
-            elif "pause" in command or "stop" in command:
-                self.press_play_pause()
-                self.log_message("⏸️ Pausing video")
-
-            # Navigation
-            elif "next" in command:
-                self.next_video()
-                self.log_message("⏭️ Next video")
-
-            elif "previous" in command or "back" in command:
-                self.previous_video()
-                self.log_message("⏮️ Previous video")
-
-            # Fullscreen
-            elif "full screen" in command or "fullscreen" in command:
-                self.toggle_fullscreen()
-                self.log_message("🔳 Toggling fullscreen")
-
-            # Volume
-            elif "volume up" in command or "louder" in command:
-                self.volume_up()
-                self.log_message("🔊 Volume up")
+        # The prefetch thread switches tabs, so don't interleave with it
+        with self.driver_lock:
+            try:
+                if not self.driver:
+                    self.log_message("❌ YouTube Kids not loaded!")
+                    return
 
-            elif "volume down" in command or "quieter" in command:
-                self.volume_down()
-                self.log_message("🔉 Volume down")
+                # Search commands
+                if any(word in command for word in ["find", "search", "look for", "show me"]):
+                    search_term = self.extract_search_term(command)
+                    if search_term:
+                        self.search_youtube_kids(search_term)
+                    else:
+                        self.log_message("❌ No search term found")
+
+                # Playback controls
+                elif any(word in command for word in ["play", "start"]) and "list" not in command:
+                    self.press_play_pause()
+                    self.log_message("▶️ Playing video")
+
+                elif "pause" in command or "stop" in command:
+                    self.press_play_pause()
+                    self.log_message("⏸️ Pausing video")
+
+                # Navigation
+                elif "next" in command:
+                    self.next_video()
+                    self.log_message("⏭️ Next video")
+
+                elif "previous" in command or "back" in command:
+                    self.previous_video()
+                    self.log_message("⏮️ Previous video")
+
+                # Fullscreen
+                elif "full screen" in command or "fullscreen" in command:
+                    self.toggle_fullscreen()
+                    self.log_message("🔳 Toggling fullscreen")
+
+                # Volume
+                elif "volume up" in command or "louder" in command:
+                    self.volume_up()
+                    self.log_message("🔊 Volume up")
+
+                elif "volume down" in command or "quieter" in command:
+                    self.volume_down()
+                    self.log_message("🔉 Volume down")
 
-            else:
-                self.log_message(f"❓ Unknown command: '{command}'")
+                else:
+                    self.log_message(f"❓ Unknown command: '{command}'")
 
-        except Exception as e:
-            self.log_message(f"❌ Error executing command: {e}")
+            except Exception as e:
+                self.log_message(f"❌ Error executing command: {e}")
 
     def extract_search_term(self, command):
         """Extract search term from voice command"""
@@ -454,6 +528,19 @@ Say "Hey Robot" followed by:
 
     def search_youtube_kids(self, search_term):
         """Search for videos on YouTube Kids"""
+        if self.SEARCH_CACHE_SIZE > 0:
+            try:
+                if self.switch_to_search_tab(search_term):
+                    self.log_message(
+                        f"⚡ Switched to ready tab for: '{search_term}'")
+                    return
+                if self.open_search_tab(search_term):
+                    self.log_message(f"🔍 Searching for: '{search_term}'")
+                    return
+            except Exception as e:
+                self.log_message(f"❌ Search tab error: {e}")
+
+        # Otherwise search in the current tab
         try:
             # Find search box
             search_box = WebDriverWait(self.driver, 10).until(
@@ -471,6 +558,140 @@ Say "Hey Robot" followed by:
         except Exception as e:
             self.log_message(f"❌ Search error: {e}")
 
+    def pause_media(self):
+        """Pause any video playing in the current tab"""
+        try:
+            self.driver.execute_script(
+                "document.querySelectorAll('video').forEach(v => v.pause())")
+        except Exception:
+            pass
+
+    def is_search_results(self, url, search_term):
+        """Check whether a URL shows the results for a search term"""
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query).get("q", [""])[0]
+        return (parsed.path.rstrip("/") == "/search"
+                and query.lower().strip() == search_term.lower().strip())
+
+    def switch_to_search_tab(self, search_term):
+        """Bring a cached results tab to the front, if it is still open"""
+        key = search_term.lower().strip()
+        handle = self.search_tabs.get(key)
+        if handle is None:
+            return False
+
+        if handle not in self.driver.window_handles:
+            # Tab was closed by hand
+            del self.search_tabs[key]
+            return False
+
+        self.search_tabs.move_to_end(key)
+        current = self.driver.current_window_handle
+        try:
+            self.pause_media()
+            self.driver.switch_to.window(handle)
+
+            # The tab may have moved on to a video since it was cached
+            if not self.is_search_results(self.driver.current_url, key):
+                self.driver.get(SEARCH_URL.format(quote_plus(key)))
+        except Exception as e:
+            self.log_message(f"❌ Search tab error: {e}")
+            self.close_search_tab(key, current)
+            return False
+
+        return True
+
+    def open_search_tab(self, search_term, background=False):
+        """Open the results page for a search term in a new cached tab
+
+        Returns False if the page could not be loaded, after closing the
+        half-opened tab and switching back to the previous one.
+        """
+        key = search_term.lower().strip()
+        url = SEARCH_URL.format(quote_plus(key))
+        current = self.driver.current_window_handle
+
+        if background:
+            # Create the tab behind the current one over DevTools, so it
+            # neither takes focus nor blocks on the page load
+            handle = self.driver.execute_cdp_cmd(
+                "Target.createTarget",
+                {"url": url, "background": True})["targetId"]
+            self.search_tabs[key] = handle
+            self.search_tabs.move_to_end(key)
+            self.evict_search_tabs(current)
+            return True
+
+        self.pause_media()
+        self.driver.switch_to.new_window('tab')
+        handle = self.driver.current_window_handle
+        self.search_tabs[key] = handle
+        self.search_tabs.move_to_end(key)
+
+        try:
+            self.driver.get(url)
+        except Exception as e:
+            self.log_message(f"❌ Search tab error: {e}")
+            self.close_search_tab(key, current)
+            return False
+
+        self.evict_search_tabs(handle)
+        return True
+
+    def close_tab(self, handle):
+        """Close a tab without bringing it to the front"""
+        self.driver.execute_cdp_cmd(
+            "Target.closeTarget", {"targetId": handle})
+
+    def close_search_tab(self, key, active=None):
+        """Close a cached results tab and drop it from the cache"""
+        handle = self.search_tabs.get(key)
+        try:
+            if handle in self.driver.window_handles:
+                self.close_tab(handle)
+            # Only forget it once closed, so cleanup can retry
+            del self.search_tabs[key]
+        except Exception:
+            pass
+
+        try:
+            if active and active != handle:
+                self.driver.switch_to.window(active)
+        except Exception:
+            pass
+
+    def evict_search_tabs(self, active):
+        """Close least recently used results tabs beyond the cache size"""
+        for key, handle in list(self.search_tabs.items()):
+            if len(self.search_tabs) <= self.SEARCH_CACHE_SIZE:
+                break
+            if handle == active:
+                continue
+            try:
+                if handle in self.driver.window_handles:
+                    self.close_tab(handle)
+                del self.search_tabs[key]
+            except Exception as e:
+                # Keep it cached so cleanup can still close it
+                self.log_message(f"❌ Closing tab error: {e}")
+
+    def prefetch_searches(self, search_terms):
+        """Load results for search terms in background tabs"""
+        opened = 0
+        for search_term in search_terms[:self.SEARCH_CACHE_SIZE]:
+            try:
+                with self.driver_lock:
+                    if search_term.lower().strip() in self.search_tabs:
+                        continue
+                    if self.open_search_tab(search_term, background=True):
+                        opened += 1
+            except Exception as e:
+                self.log_message(f"❌ Prefetch error: {e}")
+                break
+
+        if opened:
+            self.log_message(f"⚡ Prefetched {opened} popular searches")
+
     def press_play_pause(self):
         """Toggle play/pause"""
         try:
@@ -606,10 +827,18 @@ Say "Hey Robot" followed by:
         """Clean up resources"""
         self.listening = False
         if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
+            with self.driver_lock:
+                # The attached browser outlives us, so don't leave results
+                # tabs behind to pile up on every restart
+                if self.debugger_address:
+                    for key in list(self.search_tabs):
+                        self.close_search_tab(key)
+                try:
+                    # When attached, quit only ends the ChromeDriver session
+                    # and leaves the user's browser running
+                    self.driver.quit()
+                except:
+                    pass
 
     def run(self):
         """Start the application"""
@@ -640,8 +869,23 @@ def main():
     print("- Microphone access")
     print("=" * 50)
 
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--debugger-address",
+        help="attach to a running Chrome, e.g. 127.0.0.1:9222")
+    parser.add_argument(
+        "--profile-dir",
+        help="persistent Chrome profile directory for a new browser")
+    parser.add_argument(
+        "--search-cache-size", type=int, default=5,
+        help="number of search result tabs to keep open (0 disables)")
+    args = parser.parse_args()
+
     try:
-        app = YouTubeKidsVoiceController()
+        app = YouTubeKidsVoiceController(
+            debugger_address=args.debugger_address,
+            profile_dir=args.profile_dir,
+            search_cache_size=args.search_cache_size)
         app.run()
     except Exception as e:
         print(f"❌ Error starting application: {e}")